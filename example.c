@@ -26,10 +26,88 @@
 
 static void print_usage_and_quit(void)
 {
-    puts("usage: unicode [--json] codepoint");
+    puts("usage: unicode [--json] [--batch] [codepoint]");
     exit(1);
 }
 
+// Converts a code point from a string to its hexadecimal value.
+static codepoint parse_codepoint(const char *unicode_codepoint)
+{
+    // If the code point is written in "U+" notation, then advance
+    // past the 'U' and '+' so only the hexadecimal digits remain.
+    if (tolower(*unicode_codepoint) == 'u')
+    {
+        unicode_codepoint += 1; // advance past the 'u'
+        if (*unicode_codepoint == '+')
+        {
+            unicode_codepoint += 1; // advance past the '+'
+        }
+    }
+
+    return strtol(unicode_codepoint, NULL, 16);
+}
+
+// Serializes out the attributes of a code point as a JSON object.
+static void print_json(codepoint character)
+{
+    putchar('{');
+    printf("\"toLowerCase\":%d,", codepoint_tolower(character));
+    printf("\"toUpperCase\":%d,", codepoint_toupper(character));
+    printf("\"toTitleCase\":%d,", codepoint_totitle(character));
+    printf("\"toDigit\":%d,", codepoint_todigit(character));
+    printf("\"isLowerCase\":%s,", codepoint_islower(character) ? "true" : "false");
+    printf("\"isUpperCase\":%s,", codepoint_isupper(character) ? "true" : "false");
+    printf("\"isTitleCase\":%s,", codepoint_istitle(character) ? "true" : "false");
+    printf("\"isDigit\":%s,", codepoint_isdigit(character) ? "true" : "false");
+    printf("\"isSpaceChar\":%s,", codepoint_isspace(character) ? "true" : "false");
+    printf("\"isLineBreak\":%s,", (codepoint_toflags(character) & CODEPOINT_LINEBREAK) ? "true" : "false");
+    printf("\"isISOControl\":%s,", codepoint_iscntrl(character) ? "true" : "false");
+    printf("\"isPunctuation\":%s,", codepoint_ispunct(character) ? "true" : "false");
+    printf("\"isConnectingChar\":%s,", (codepoint_toflags(character) & CODEPOINT_CONNECTING) ? "true" : "false");
+    printf("\"isFormattingChar\":%s,", (codepoint_toflags(character) & CODEPOINT_FORMATTING) ? "true" : "false");
+    printf("\"isCombiningChar\":%s,", (codepoint_toflags(character) & CODEPOINT_COMBINING) ? "true" : "false");
+    printf("\"isEmoji\":%s,", codepoint_isemoji(character) ? "true" : "false");
+    printf("\"isPrintable\":%s,", codepoint_isprint(character) ? "true" : "false");
+    printf("\"isAlpha\":%s,", codepoint_isalpha(character) ? "true" : "false");
+    printf("\"isAlphaNumeric\":%s,", codepoint_isalnum(character) ? "true" : "false");
+    printf("\"isValidCodePoint\":%s", codepoint_isvalid(character) ? "true" : "false");
+    putchar('}');
+}
+
+// Serializes out the attributes of a code point as plain text.
+static void print_text(codepoint character)
+{
+    printf("toLowerCase: %d\n", codepoint_tolower(character));
+    printf("toUpperCase: %d\n", codepoint_toupper(character));
+    printf("toTitleCase: %d\n", codepoint_totitle(character));
+    printf("toDigit: %d\n", codepoint_todigit(character));
+    printf("isLowerCase: %d\n", codepoint_islower(character));
+    printf("isUpperCase: %d\n", codepoint_isupper(character));
+    printf("isTitleCase: %d\n", codepoint_istitle(character));
+    printf("isDigit: %d\n", codepoint_isdigit(character));
+    printf("isSpaceChar: %d\n", codepoint_isspace(character));
+    printf("isISOControl: %d\n", codepoint_iscntrl(character));
+    printf("isPunctuation: %d\n", codepoint_ispunct(character));
+    printf("isEmoji: %d\n", codepoint_isemoji(character));
+    printf("isPrintable: %d\n", codepoint_isprint(character));
+    printf("isAlpha: %d\n", codepoint_isalpha(character));
+    printf("isAlphaNumeric: %d\n", codepoint_isalnum(character));
+    printf("isValidCodePoint: %d\n", codepoint_isvalid(character));
+}
+
+// Serializes out the attributes of a code point in the requested format.
+static void print_codepoint(codepoint character, bool output_json)
+{
+    if (output_json)
+    {
+        print_json(character);
+    }
+    else
+    {
+        print_text(character);
+    }
+}
+
 int main(int argc, char *argv[])
 {
     if (argc < 2)
@@ -39,6 +117,7 @@ int main(int argc, char *argv[])
 
     int codepoint_argument_index = -1; // Assume the user fails to pass a code point until proven otherwise.
     bool output_json = false; // Assume textual output until asked to emit JSON.
+    bool batch = false; // Assume a single code point until asked to read them from stdin.
 
     for (int i = 1; i < argc; i++)
     {
@@ -49,6 +128,10 @@ int main(int argc, char *argv[])
             {
                 output_json = true;
             }
+            else if (strcmp(argv[i], "--batch") == 0)
+            {
+                batch = true;
+            }
         }
         else
         {
@@ -57,73 +140,43 @@ int main(int argc, char *argv[])
         }
     }
 
-    // If no code point was supplied, then exit.
-    if (codepoint_argument_index < 0)
+    // In batch mode the code points are read from stdin, separated by whitespace,
+    // and the attributes of each one are serialized out in turn: one JSON object
+    // per line with --json, otherwise blocks of text separated by a blank line.
+    // This lets many code points be queried without launching the program for each one.
+    if (batch)
     {
-        print_usage_and_quit();
-    }
-
-    const char *unicode_codepoint = argv[codepoint_argument_index];
-
-    // If the code point is written in "U+" notation, then advance
-    // past the 'U' and '+' so only the hexadecimal digits remain.
-    if (tolower(*unicode_codepoint) == 'u')
-    {
-        unicode_codepoint += 1; // advance past the 'u'
-        if (*unicode_codepoint == '+')
+        // The code points come from stdin so a code point argument is an error.
+        if (codepoint_argument_index >= 0)
         {
-            unicode_codepoint += 1; // advance past the '+'
+            print_usage_and_quit();
         }
-    }
 
-    // Convert the code point from a string to its hexadecimal value,
-    // then serialize out its attributes.
-    const codepoint character = strtol(unicode_codepoint, NULL, 16);
+        char unicode_codepoint[32];
+        while (scanf("%31s", unicode_codepoint) == 1)
+        {
+            // If the code point didn't fit in the buffer, then exit rather than splitting it in two.
+            const int next = getchar();
+            if (next != EOF && !isspace(next))
+            {
+                fprintf(stderr, "code point too long: %s...\n", unicode_codepoint);
+                return 1;
+            }
 
-    if (output_json)
-    {
-        putchar('{');
-        printf("\"toLowerCase\":%d,", codepoint_tolower(character));
-        printf("\"toUpperCase\":%d,", codepoint_toupper(character));
-        printf("\"toTitleCase\":%d,", codepoint_totitle(character));
-        printf("\"toDigit\":%d,", codepoint_todigit(character));
-        printf("\"isLowerCase\":%s,", codepoint_islower(character) ? "true" : "false");
-        printf("\"isUpperCase\":%s,", codepoint_isupper(character) ? "true" : "false");
-        printf("\"isTitleCase\":%s,", codepoint_istitle(character) ? "true" : "false");
-        printf("\"isDigit\":%s,", codepoint_isdigit(character) ? "true" : "false");
-        printf("\"isSpaceChar\":%s,", codepoint_isspace(character) ? "true" : "false");
-        printf("\"isLineBreak\":%s,", (codepoint_toflags(character) & CODEPOINT_LINEBREAK) ? "true" : "false");
-        printf("\"isISOControl\":%s,", codepoint_iscntrl(character) ? "true" : "false");
-        printf("\"isPunctuation\":%s,", codepoint_ispunct(character) ? "true" : "false");
-        printf("\"isConnectingChar\":%s,", (codepoint_toflags(character) & CODEPOINT_CONNECTING) ? "true" : "false");
-        printf("\"isFormattingChar\":%s,", (codepoint_toflags(character) & CODEPOINT_FORMATTING) ? "true" : "false");
-        printf("\"isCombiningChar\":%s,", (codepoint_toflags(character) & CODEPOINT_COMBINING) ? "true" : "false");
-        printf("\"isEmoji\":%s,", codepoint_isemoji(character) ? "true" : "false");
-        printf("\"isPrintable\":%s,", codepoint_isprint(character) ? "true" : "false");
-        printf("\"isAlpha\":%s,", codepoint_isalpha(character) ? "true" : "false");
-        printf("\"isAlphaNumeric\":%s,", codepoint_isalnum(character) ? "true" : "false");
-        printf("\"isValidCodePoint\":%s", codepoint_isvalid(character) ? "true" : "false");
-        putchar('}');
+            print_codepoint(parse_codepoint(unicode_codepoint), output_json);
+            putchar('\n');
+        }
+        return 0;
     }
-    else
+
+    // If no code point was supplied, then exit.
+    if (codepoint_argument_index < 0)
     {
-        printf("toLowerCase: %d\n", codepoint_tolower(character));
-        printf("toUpperCase: %d\n", codepoint_toupper(character));
-        printf("toTitleCase: %d\n", codepoint_totitle(character));
-        printf("toDigit: %d\n", codepoint_todigit(character));
-        printf("isLowerCase: %d\n", codepoint_islower(character));
-        printf("isUpperCase: %d\n", codepoint_isupper(character));
-        printf("isTitleCase: %d\n", codepoint_istitle(character));
-        printf("isDigit: %d\n", codepoint_isdigit(character));
-        printf("isSpaceChar: %d\n", codepoint_isspace(character));
-        printf("isISOControl: %d\n", codepoint_iscntrl(character));
-        printf("isPunctuation: %d\n", codepoint_ispunct(character));
-        printf("isEmoji: %d\n", codepoint_isemoji(character));
-        printf("isPrintable: %d\n", codepoint_isprint(character));
-        printf("isAlpha: %d\n", codepoint_isalpha(character));
-        printf("isAlphaNumeric: %d\n", codepoint_isalnum(character));
-        printf("isValidCodePoint: %d\n", codepoint_isvalid(character));
+        print_usage_and_quit();
     }
 
+    // Convert the code point from a string to its hexadecimal value,
+    // then serialize out its attributes.
+    print_codepoint(parse_codepoint(argv[codepoint_argument_index]), output_json);
     return 0;
 }
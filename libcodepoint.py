@@ -16,11 +16,13 @@
 #  You should have received a copy of the GNU Affero General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Dict, Iterable
+from typing import List, Dict, Iterable, Iterator, NamedTuple, Tuple
 import os
 import sys
-import csv
+import array
+import gzip
 import urllib.request
+import concurrent.futures
 import argparse
 
 FILE_NAME = os.path.basename(sys.argv[0])
@@ -43,49 +45,101 @@ CONNECTING_MASK = 0x800
 COMBINING_MASK = 0x1000
 FORMATTING_MASK = 0x2000
 
+# The flags implied by each Unicode General Category.
+# See: https://www.unicode.org/reports/tr44/#General_Category_Values
+CATEGORY_FLAGS = {
+    'Lu': ALPHA_MASK | PRINTABLE_MASK,
+    'Ll': ALPHA_MASK | PRINTABLE_MASK,
+    'Lt': ALPHA_MASK | TITLE_MASK | PRINTABLE_MASK,
+    'Lm': ALPHA_MASK | PRINTABLE_MASK,
+    'Lo': ALPHA_MASK | PRINTABLE_MASK,
+    'Mn': COMBINING_MASK | PRINTABLE_MASK,
+    'Mc': COMBINING_MASK | PRINTABLE_MASK,
+    'Me': PRINTABLE_MASK,
+    'Nd': DIGIT_MASK | PRINTABLE_MASK,
+    'Nl': ALPHA_MASK | DIGIT_MASK | PRINTABLE_MASK,
+    'No': PRINTABLE_MASK,
+    'Pc': PUNCTUATION_MASK | CONNECTING_MASK | PRINTABLE_MASK,
+    'Pd': PUNCTUATION_MASK | PRINTABLE_MASK,
+    'Ps': PUNCTUATION_MASK | PRINTABLE_MASK,
+    'Pe': PUNCTUATION_MASK | PRINTABLE_MASK,
+    'Pi': PUNCTUATION_MASK | PRINTABLE_MASK,
+    'Pf': PUNCTUATION_MASK | PRINTABLE_MASK,
+    'Po': PUNCTUATION_MASK | PRINTABLE_MASK,
+    'Sm': PRINTABLE_MASK,
+    'Sc': PRINTABLE_MASK,
+    'Sk': PRINTABLE_MASK,
+    'So': PRINTABLE_MASK,
+    'Zs': SPACE_MASK,
+    'Zl': LINEBREAK_MASK,
+    'Zp': LINEBREAK_MASK,
+    'Cc': CONTROL_MASK,
+    'Cf': FORMATTING_MASK,
+    'Cs': 0,
+    'Co': 0,
+    'Cn': 0,
+}
+
+
+class Codepoint(NamedTuple):
+    upper: int
+    lower: int
+    title: int
+    digit: int
+    flags: int
+
+
+def read_fields(file: Iterable[str]) -> Iterator[List[str]]:
+    """
+    This function splits the lines of a Unicode database file into their fields.
+    The files are semicolon delimited with '#' comments and no quoting so comments and blank lines are stripped out.
+    """
+    for row in file:
+        raw = row.split('#', 1)[0].strip()
+        if raw:
+            yield raw.split(';')
 
-class Codepoint:
-    def __init__(self, upper: int, lower: int, title: int, digit: int, flags: int):
-        self.upper = upper
-        self.lower = lower
-        self.title = title
-        self.digit = digit
-        self.flags = flags
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Codepoint):
-            return NotImplemented
-        if self.upper == other.upper and \
-           self.lower == other.lower and \
-           self.title == other.title and \
-           self.digit == other.digit and \
-           self.flags == other.flags:
-            return True
-        return False
-
-    def __hash__(self) -> int:
-        return (hash(self.upper) << 24) ^ (hash(self.lower) << 20) ^ (hash(self.title) << 16) ^ (hash(self.digit) << 8) ^ hash(self.flags)
-
-
-class UnicodeDataRecord:
-    def __init__(self, record: List[str]):
-        # 15 fields from UnicodeData.txt
-        # See: https://www.unicode.org/reports/tr44/#UnicodeData.txt
-        self.codepoint = int(record[0], 16)
-        self.name = record[1]
-        self.category = record[2]
-        self.canonical_combining_class = record[3]
-        self.bidi_class = record[4]
-        self.decomposition_type = record[5]
-        self.decomposition_mapping = record[6]
-        self.numeric_type = int(record[7]) if record[7] else 0
-        self.numeric_value = record[8]
-        self.bidi_mirrored = record[9]
-        self.unicode_1_name = record[10]  # obsolete
-        self.iso_comment = record[11]  # obsolete
-        self.uppercase_mapping = int(record[12], 16) if record[12] else 0
-        self.lowercase_mapping = int(record[13], 16) if record[13] else 0
-        self.titlecase_mapping = int(record[14], 16) if record[14] else 0
+
+def read_ranges(file: Iterable[str]) -> Iterator[Tuple[int, int, str]]:
+    """
+    This function reads a Unicode database file that assigns a property to a code point or a range of code points.
+    It yields the first and last code point of each line along with the property.
+    """
+    for line in read_fields(file):
+        codepoint_range = line[0].split('..')
+        first_codepoint = int(codepoint_range[0], 16)
+        last_codepoint = int(codepoint_range[-1], 16)
+        yield (first_codepoint, last_codepoint, line[1].strip())
+
+
+def download_file(url: str, path: str) -> None:
+    """
+    This function downloads a URL to a file path.
+    The server is asked to gzip the response since the Unicode database files are plain text and compress well.
+    """
+    request = urllib.request.Request(url, headers={'Accept-Encoding': 'gzip'})
+    with urllib.request.urlopen(request) as response:
+        data = response.read()
+        if response.headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+
+    with open(path, 'wb') as file:
+        file.write(data)
+
+
+def download_files(downloads: List[Tuple[str, str]]) -> None:
+    """
+    This function downloads each URL to its file path unless the file already exists.
+    The downloads are independent of each other so they're fetched concurrently.
+    """
+    missing = [(url, path) for url, path in downloads if not os.path.exists(path)]
+    if not missing:
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(missing)) as executor:
+        futures = [executor.submit(download_file, url, path) for url, path in missing]
+        for future in futures:
+            future.result()  # Re-raise any exception from the download.
 
 
 def collect_code_points_from_unicode_database() -> Dict[int, Codepoint]:
@@ -106,135 +160,145 @@ def collect_code_points_from_unicode_database() -> Dict[int, Codepoint]:
     emoji_data_url = f'http://unicode.org/Public/{UNICODE_VERSION}/ucd/emoji/emoji-data.txt'
 
     unicode_data_file = os.path.join(outdir, 'UnicodeData.txt')
-    if not os.path.exists(unicode_data_file):
-        urllib.request.urlretrieve(unicode_data_url, unicode_data_file)
-
     derived_core_properties_file = os.path.join(outdir, 'DerivedCoreProperties.txt')
-    if not os.path.exists(derived_core_properties_file):
-        urllib.request.urlretrieve(derived_core_properties_url, derived_core_properties_file)
-
     line_break_file = os.path.join(outdir, 'LineBreak.txt')
-    if not os.path.exists(line_break_file):
-        urllib.request.urlretrieve(line_break_url, line_break_file)
-
     emoji_data_file = os.path.join(outdir, 'emoji-data.txt')
-    if not os.path.exists(emoji_data_file):
-        urllib.request.urlretrieve(emoji_data_url, emoji_data_file)
+
+    download_files([
+        (unicode_data_url, unicode_data_file),
+        (derived_core_properties_url, derived_core_properties_file),
+        (line_break_url, line_break_file),
+        (emoji_data_url, emoji_data_file),
+    ])
 
     # This is the dictionary this function builds that will contain all Unicode Codepoints.
     # The key is the code point number and the value is information about the code point.
     codepoints: Dict[int, Codepoint] = {}
 
-    # Python's CSV library lacks handling '#" comments.
-    # This function will stip them out.
-    def decomment(csvfile: Iterable[str]) -> Iterable[str]:
-        for row in csvfile:
-            raw = row.split('#')[0].strip()
-            if raw:
-                yield raw
-
     # Read all code points from the UnicodeData.txt file.
+    # This file has no comments so each line is split directly.
     with open(unicode_data_file, encoding='utf-8-sig') as file:
-        reader = csv.reader(decomment(file), delimiter=';')
-        for line in reader:
-            record = UnicodeDataRecord(line)
-
-            flags = 0
-            if record.category in ['Lm', 'Lt', 'Lu', 'Ll', 'Lo', 'Nl']:
-                flags |= ALPHA_MASK
-            if record.category == 'Lt':
-                flags |= TITLE_MASK
-            if record.category == 'Zs':
-                flags |= SPACE_MASK
-            if record.category in ['Pc', 'Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po']:
-                flags |= PUNCTUATION_MASK
-            if record.category == 'Pc':
-                flags |= CONNECTING_MASK
-            if record.category in ['Mn', 'Mc']:
-                flags |= COMBINING_MASK
-            if record.category == 'Cf':
-                flags |= FORMATTING_MASK
-            if record.category == 'Cc':
-                flags |= CONTROL_MASK
-            if record.category[0] not in ['C', 'Z'] or record.codepoint == ord(' '):
-                flags |= PRINTABLE_MASK
-            if record.category in ['Nd', 'Nl']:
-                flags |= DIGIT_MASK
-            if record.category in ['Zl', 'Zp']:
-                flags |= LINEBREAK_MASK
+        for row in file:
+            line = row.rstrip('\r\n').split(';')
+            if len(line) < 15:
+                continue  # skip blank lines
+
+            # Only some of the 15 fields from UnicodeData.txt are needed.
+            # See: https://www.unicode.org/reports/tr44/#UnicodeData.txt
+            codepoint = int(line[0], 16)
+            name = line[1]
+            category = line[2]
+            numeric_type = int(line[7]) if line[7] else 0
+            uppercase_mapping = int(line[12], 16) if line[12] else 0
+            lowercase_mapping = int(line[13], 16) if line[13] else 0
+            titlecase_mapping = int(line[14], 16) if line[14] else 0
+
+            flags = CATEGORY_FLAGS.get(category, 0)
+            if codepoint == ord(' '):
+                flags |= PRINTABLE_MASK  # The space character is the only printable separator.
+
+            data = Codepoint(uppercase_mapping, lowercase_mapping, titlecase_mapping, numeric_type, flags)
 
             # Count all the CJK Ideograph and Hangul Syllable ranges and
             # generate names
-            if ('Ideograph' in record.name or record.name.startswith('<Hangul')) and record.name.endswith('First>'):
-                next_line = next(reader)
-                next_codepoint = int(next_line[0], 16)
-                for i in range(record.codepoint, next_codepoint + 1):
-                    codepoints[i] = Codepoint(record.uppercase_mapping, record.lowercase_mapping, record.titlecase_mapping, record.numeric_type, flags)
+            # The cheap suffix test comes first since it rules out every code point that doesn't start a range.
+            # All code points in a range share the same immutable data so it's assigned to them at once.
+            if name.endswith('First>') and ('Ideograph' in name or name.startswith('<Hangul')):
+                last_codepoint = int(next(file).split(';')[0], 16)
+                codepoints.update(dict.fromkeys(range(codepoint, last_codepoint + 1), data))
             else:
-                codepoints[record.codepoint] = Codepoint(
-                    record.uppercase_mapping, record.lowercase_mapping, record.titlecase_mapping, record.numeric_type, flags)
+                codepoints[codepoint] = data
+
+    # The flags from the remaining UCD files are collected as ranges of code points.
+    # Each range is tagged with the flag it implies and all ranges are merged in a single pass.
+    flag_ranges: List[Tuple[int, int, int]] = []
 
     # Gather additional case information from the DerivedCoreProperties.txt file.
     with open(derived_core_properties_file, encoding='utf-8-sig') as file:
-        reader = csv.reader(decomment(file), delimiter=';')
-        for line in reader:
-            codepoint_range = line[0].split('..')
-            properties = line[1].strip()
-
-            if len(codepoint_range) > 1:
-                first_codepoint = int(codepoint_range[0], 16)
-                last_codepoint = int(codepoint_range[1], 16)
-            else:
-                first_codepoint = int(codepoint_range[0], 16)
-                last_codepoint = first_codepoint
-
-            for i in range(first_codepoint, last_codepoint + 1):
-                if i in codepoints:
-                    if properties == 'Lowercase':
-                        codepoints[i].flags |= LOWER_MASK
-                    elif properties == 'Uppercase':
-                        codepoints[i].flags |= UPPER_MASK
+        for first_codepoint, last_codepoint, properties in read_ranges(file):
+            if properties == 'Lowercase':
+                flag_ranges += [(first_codepoint, last_codepoint, LOWER_MASK)]
+            elif properties == 'Uppercase':
+                flag_ranges += [(first_codepoint, last_codepoint, UPPER_MASK)]
 
     # Gather line seperator information from the LineBreak.txt file
     with open(line_break_file, encoding='utf-8-sig') as file:
-        reader = csv.reader(decomment(file), delimiter=';')
-        for line in reader:
-            codepoint_range = line[0].split('..')
-            properties = line[1].strip()
-
-            if len(codepoint_range) > 1:
-                first_codepoint = int(codepoint_range[0], 16)
-                last_codepoint = int(codepoint_range[1], 16)
-            else:
-                first_codepoint = int(codepoint_range[0], 16)
-                last_codepoint = first_codepoint
-
-            for i in range(first_codepoint, last_codepoint + 1):
-                if i in codepoints:
-                    if properties in ['NL', 'LF', 'CR']:
-                        codepoints[i].flags |= LINEBREAK_MASK
+        for first_codepoint, last_codepoint, properties in read_ranges(file):
+            if properties in ['NL', 'LF', 'CR']:
+                flag_ranges += [(first_codepoint, last_codepoint, LINEBREAK_MASK)]
 
     # Gather additional case information from the emoji-data.txt file.
     # This file is only available for Unicode 13.0+
     with open(emoji_data_file, encoding='utf-8-sig') as file:
-        reader = csv.reader(decomment(file), delimiter=';')
-        for line in reader:
-            codepoint_range = line[0].split('..')
+        for first_codepoint, last_codepoint, properties in read_ranges(file):
+            flag_ranges += [(first_codepoint, last_codepoint, EMOJI_MASK)]
 
-            if len(codepoint_range) > 1:
-                first_codepoint = int(codepoint_range[0], 16)
-                last_codepoint = int(codepoint_range[1], 16)
-            else:
-                first_codepoint = int(codepoint_range[0], 16)
-                last_codepoint = first_codepoint
+    # Accumulate the flags for every code point in a flat array.
+    # This way each code point is only updated once, no matter how many ranges it belongs to.
+    extra_flags = array.array('i', [0]) * MAX_CODEPOINTS
+    for first_codepoint, last_codepoint, mask in flag_ranges:
+        for i in range(first_codepoint, last_codepoint + 1):
+            extra_flags[i] |= mask
 
-            for i in range(first_codepoint, last_codepoint + 1):
-                if i in codepoints:
-                    codepoints[i].flags |= EMOJI_MASK
+    for i, entry in codepoints.items():
+        if extra_flags[i]:
+            codepoints[i] = entry._replace(flags=entry.flags | extra_flags[i])
 
     return codepoints
 
 
+def build_two_stage_table(codepoint_indices: 'array.array[int]') -> Tuple['array.array[int]', 'array.array[int]']:
+    """
+    This function builds a Two-stage table, as recommended by Chapter 5.1 of The Unicode Standard, from the index of every code point.
+    The stage1 table maps each bucket of code points to the offset of its contents within the stage2 table.
+    """
+    # Both tables are stored as compact arrays of machine integers rather than lists of Python integers.
+    stage1 = array.array('i')
+    stage2 = array.array('i')
+
+    # Maps the contents of each unique stage2 table to its offset within the stage2 table.
+    # This finds duplicate tables with a single hash lookup rather than a linear scan.
+    stage2_offsets: Dict[bytes, int] = {}
+
+    # The stage2 table built for the previous bucket.
+    previous_table = array.array('i')
+
+    # Only build stage2 tables on bucket boundaries.
+    for code in range(0, MAX_CODEPOINTS, BUCKET_SIZE):
+        # Slice out a stage2 table for the current range of codepoints.
+        # This table may be discarded if it's a duplicate of another table.
+        stage2_table = codepoint_indices[code:code + BUCKET_SIZE]
+
+        # Dense ranges like the CJK Ideograph and Hangul Syllable blocks, as well as the unassigned planes,
+        # produce long runs of identical tables. These reuse the previous table without a hash lookup.
+        if stage2_table == previous_table:
+            stage1.append(stage1[-1])
+            continue
+        previous_table = stage2_table
+
+        key = stage2_table.tobytes()
+        offset = stage2_offsets.get(key)
+        if offset is None:
+            offset = len(stage2)
+            stage2.extend(stage2_table)
+            stage2_offsets[key] = offset
+        stage1.append(offset)
+
+    return (stage1, stage2)
+
+
+def format_table(values: 'array.array[int]') -> str:
+    """
+    This function formats a table of integers for a C array initializer with eight values per line.
+    The whole table is formatted by a single operation using a template with one placeholder per value.
+    """
+    rows, remainder = divmod(len(values), 8)
+    template = ('\n    ' + '%d, ' * 8) * rows
+    if remainder:
+        template += '\n    ' + '%d, ' * remainder
+    return template % tuple(values)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--no-stdint", help="prevents inclusion of the stdint.h header", action="store_true")
@@ -260,261 +324,240 @@ def main() -> None:
     unique_codepoints[Codepoint(0, 0, 0, 0, 0)] = 0
 
     # Now add all the code points to create an ordered set.
+    # The setdefault() method only hashes the code point once whether or not it's already present.
     for codepoint in codepoints.values():
-        if codepoint not in unique_codepoints:
-            unique_codepoints[codepoint] = len(unique_codepoints)
+        unique_codepoints.setdefault(codepoint, len(unique_codepoints))
 
-    # Build a Two-stage table for storing all code points.
-    # This is recommended by Chapter 5.1 of The Unicode Standard.
-    stage1: List[int] = []
-    stage2: List[int] = []
-    stage2_tables: List[List[int]] = []
-
-    for code in range(MAX_CODEPOINTS):
-        # Only build stage2 tables on bucket boundaries.
-        if (code % BUCKET_SIZE) != 0:
-            continue
+    # Map each code point in the Unicode code space to its index within the ordered set of code points.
+    # Only a subset of the avaiable Unicode character space is mapped to real characters.
+    # Code points that don't exist default to the null codepoint at index zero.
+    codepoint_indices = array.array('i', [0]) * MAX_CODEPOINTS
+    for code, codepoint in codepoints.items():
+        codepoint_indices[code] = unique_codepoints[codepoint]
 
-        # Build a stage2 table for the current range of codepoints.
-        # This table may be discarded if it's a duplicate of another table.
-        stage2_table = []
-
-        for code2 in range(code, code + BUCKET_SIZE):
-            if code2 in codepoints:
-                codepoint = codepoints[code2] # Grab the codepoint.
-                if codepoint in unique_codepoints: # Find its index within the ordered set of code points.
-                    stage2_table += [unique_codepoints[codepoint]]
-                    continue
-
-            # Only a subset of the avaiable Unicode character space is mapped to real characters.
-            # The current codepoint happens to not exists so default to the null codepoint.
-            stage2_table += [0]
-
-        if stage2_table in stage2_tables:
-            stage1 += [stage2_tables.index(stage2_table) * BUCKET_SIZE]
-        else:
-            stage1 += [len(stage2)]
-            stage2 += stage2_table
-            stage2_tables += [stage2_table]
+    # Build a Two-stage table for storing all code points.
+    stage1, stage2 = build_two_stage_table(codepoint_indices)
 
     if args.info:
         print('Total code points: %d' % (len(codepoints)))
         print('Unique code points: %d' % (len(unique_codepoints)))
         print('')
 
-    with open(args.outfile, 'w') as file:
-        element_size_in_bytes = 20
-        code_points_size = (len(unique_codepoints) * element_size_in_bytes) / 1024
-        stage1_table_size = (len(stage1) * 4) / 1024
-        stage2_table_size = (len(stage2) * 4) / 1024
-        total_size = code_points_size + stage1_table_size + stage2_table_size
-
-        if args.info:
-            print(
-                'Uncompressed code points table size: %d kilobytes' % ((len(codepoints) * element_size_in_bytes) / 1024))
-            print('Compressed code points table size: %d kilobytes' % (code_points_size))
-            print('Stage1 table size: %d kilobytes' % (stage1_table_size))
-            print('Stage2 table size: %d kilobytes' % (stage2_table_size))
-            print('')
-            print('Total compressed size: %d kilobytes' % (total_size))
-
-        file.write('// Do NOT edit this file.\n')
-        file.write('// This file was programmatically generated by %s\n' % (FILE_NAME))
-        file.write('// It contains %d kilobytes of data.\n' % (total_size))
-        file.write('\n')
-
-        if args.no_stdint:
-            code_point_type = 'long'
-        else:
-            file.write('#include <stdint.h>\n')
-            file.write('\n')
-            code_point_type = 'int32_t'
-
-        prefix = args.prefix
-        prefix_upper = prefix.upper()
-
-        file.write('// ---------------------------------------------\n')
-        file.write('// Start of Public Interface\n')
-        file.write('// ---------------------------------------------\n')
-
-        file.write('\n')
-        file.write('#ifndef CODEPOINT_DEFINITIONS\n')
-        file.write('#define CODEPOINT_DEFINITIONS\n')
-        file.write('\n')
-
-        file.write(f'typedef {code_point_type} {prefix}codepoint;\n')
-        file.write('\n')
-
-        file.write(f'{prefix}codepoint {prefix}codepoint_tolower({prefix}codepoint character);\n')
-        file.write(f'{prefix}codepoint {prefix}codepoint_toupper({prefix}codepoint character);\n')
-        file.write(f'{prefix}codepoint {prefix}codepoint_totitle({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_todigit({prefix}codepoint character);\n')
-        file.write(f'long {prefix}codepoint_toflags({prefix}codepoint character);\n')
-        file.write('\n')
-        file.write(f'int {prefix}codepoint_islower({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_isupper({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_istitle({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_isdigit({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_isspace({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_iscntrl({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_ispunct({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_isemoji({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_isprint({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_isalpha({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_isalnum({prefix}codepoint character);\n')
-        file.write(f'int {prefix}codepoint_isvalid({prefix}codepoint character);\n')
-
-        # Write masks.
-        file.write('\n')
-        file.write(f"#define {prefix_upper}CODEPOINT_ALPHA 0x%0X // Unicode character classes 'Lm', 'Lt', 'Lu', 'Ll', 'Lo', 'Nl'\n" % (ALPHA_MASK))
-        file.write(f"#define {prefix_upper}CODEPOINT_DIGIT 0x%0X // Unicode character classes 'Nd', 'Nl'\n" % (DIGIT_MASK))
-        file.write(f'#define {prefix_upper}CODEPOINT_LOWER 0x%0x\n' % (LOWER_MASK))
-        file.write(f'#define {prefix_upper}CODEPOINT_UPPER 0x%0x\n' % (UPPER_MASK))
-        file.write(f"#define {prefix_upper}CODEPOINT_TITLE 0x%0x // Unicode character class 'Lt'\n" % (TITLE_MASK))
-        file.write(f"#define {prefix_upper}CODEPOINT_SPACE 0x%0x // Unicode character class 'Zs'\n" % (SPACE_MASK))
-        file.write(f'#define {prefix_upper}CODEPOINT_PRINTABLE 0x%0x\n' % (PRINTABLE_MASK))
-        file.write(f"#define {prefix_upper}CODEPOINT_PUNCTUATION 0x%0x // Unicode character classes 'Pc', 'Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po'\n" % (PUNCTUATION_MASK))
-        file.write(f"#define {prefix_upper}CODEPOINT_CONTROL 0x%0x // Unicode character class 'Cc'\n" % (CONTROL_MASK))
-        file.write(f'#define {prefix_upper}CODEPOINT_EMOJI 0x%0x\n' % (EMOJI_MASK))
-        file.write(f'#define {prefix_upper}CODEPOINT_LINEBREAK 0x%0x\n' % (LINEBREAK_MASK))
-        file.write(f"#define {prefix_upper}CODEPOINT_CONNECTING 0x%0x // Unicode character class 'Pc'\n" % (CONNECTING_MASK))
-        file.write(f"#define {prefix_upper}CODEPOINT_COMBINING 0x%0x // Unicode character classes 'Mn', 'Mc'\n" % (COMBINING_MASK))
-        file.write(f"#define {prefix_upper}CODEPOINT_FORMATTING 0x%0x // Unicode character class 'Cf'\n" % (FORMATTING_MASK))
-
-        file.write('\n')
-        file.write('#endif\n')  # end of definitions
-        file.write('\n')
-
-        file.write('// ---------------------------------------------\n')
-        file.write('// End of Public Interface\n')
-        file.write('// ---------------------------------------------\n')
-
-        file.write('\n')
-        # beginning of implementation
-        file.write('#ifdef CODEPOINT_IMPLEMENTATION\n')
-        file.write('\n')
-
-        # Write unique codepoints.
-        file.write('// This table is a set of %d unique code points.\n' % (len(unique_codepoints)))
-        file.write('// It is %d bytes in size.\n' % (len(unique_codepoints) * element_size_in_bytes))
-        file.write(f'static const struct {prefix}codepointdata {{\n')
-        file.write(f'    {prefix}codepoint upper;\n')
-        file.write(f'    {prefix}codepoint lower;\n')
-        file.write(f'    {prefix}codepoint title;\n')
-        file.write('    int numeric_value;\n')
-        file.write(f'    {code_point_type} flags;\n')
-        file.write('} unicode_codepoints[] = {\n')
-        for record in unique_codepoints:
-            file.write('    {%d, %d, %d, %d, %d},\n' % (record.upper, record.lower, record.title, record.digit, record.flags))
-        file.write('};\n\n')
-
-        # Write stage1 table.
-        file.write(f'static const {prefix}codepoint stage1_table[] = {{')
-        for index, value in enumerate(stage1):
-            if (index % 8) == 0:
-                file.write('\n')
-                file.write('    ')
-            file.write('%d, ' % (value))
-        file.write('\n')
-        file.write('};\n\n')
-
-        # Write stage2 table.
-        file.write(f'static const {prefix}codepoint stage2_table[] = {{')
-        for index, value in enumerate(stage2):
-            if (index % 8) == 0:
-                file.write('\n')
-                file.write('    ')
-            file.write('%d, ' % (value))
-        file.write('\n')
-        file.write('};\n\n')
-
-        # If the inline keyword is enabled, then generate the following function with it.
-        inline_keyword = '' if args.no_inline else 'inline '
-
-        # Write helper function.
-        file.write(f'static {inline_keyword}const struct {prefix}codepointdata *{prefix}getcodepointdata({prefix}codepoint ch) {{\n')
-        file.write('    if (ch >= %d) {\n' % (MAX_CODEPOINTS))
-        file.write('        return &unicode_codepoints[0]; // code point out of range\n')
-        file.write('    }\n')
-        file.write('    const int stage2_offset = stage1_table[ch / %d];\n' % (BUCKET_SIZE))
-        file.write('    const int codepoint_index = stage2_table[stage2_offset + (ch %% %d)];\n' % (BUCKET_SIZE))
-        file.write('    return &unicode_codepoints[codepoint_index];\n')
-        file.write('}\n\n')
-
-        # Write API functions.
-        file.write(f'{prefix}codepoint {prefix}codepoint_tolower({prefix}codepoint character) {{\n')
-        file.write(f'    const {prefix}codepoint cp = {prefix}getcodepointdata(character)->lower;\n')
-        file.write('    return (cp == 0) ? character : cp;\n')
-        file.write('}\n\n')
-
-        file.write(f'{prefix}codepoint {prefix}codepoint_toupper({prefix}codepoint character) {{\n')
-        file.write(f'    const {prefix}codepoint cp = {prefix}getcodepointdata(character)->upper;\n')
-        file.write('    return (cp == 0) ? character : cp;\n')
-        file.write('}\n\n')
-
-        file.write(f'{prefix}codepoint {prefix}codepoint_totitle({prefix}codepoint character) {{\n')
-        file.write(f'    const {prefix}codepoint cp = {prefix}getcodepointdata(character)->title;\n')
-        file.write('    return (cp == 0) ? character : cp;\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_todigit({prefix}codepoint character) {{\n')
-        file.write(f'    return {prefix}getcodepointdata(character)->numeric_value;\n')
-        file.write('}\n\n')
-
-        file.write(f'long {prefix}codepoint_toflags({prefix}codepoint character) {{\n')
-        file.write(f'    return {prefix}getcodepointdata(character)->flags;\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_islower({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_LOWER);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_isupper({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_UPPER);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_istitle({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_TITLE);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_isdigit({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_DIGIT);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_isspace({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_SPACE);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_ispunct({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_PUNCTUATION);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_isprint({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_PRINTABLE);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_iscntrl({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_CONTROL);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_isemoji({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_EMOJI);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_isalpha({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_ALPHA);\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_isalnum({prefix}codepoint character) {{\n')
-        file.write(f'    return !!({prefix}getcodepointdata(character)->flags & ({prefix_upper}CODEPOINT_ALPHA | {prefix_upper}CODEPOINT_DIGIT));\n')
-        file.write('}\n\n')
-
-        file.write(f'int {prefix}codepoint_isvalid({prefix}codepoint character) {{\n')
-        file.write(f'    return {prefix}getcodepointdata(character) != &unicode_codepoints[0];\n')
-        file.write('}\n\n')
-
-        file.write('#endif\n')  # end of implementation
-        file.write('\n')
+    # The generated C source is accumulated in memory, encoded once, and written out with a single call.
+    # The append method is bound to a local once rather than looked up on every call.
+    output: List[str] = []
+    append = output.append
+
+    element_size_in_bytes = 20
+    code_points_size = (len(unique_codepoints) * element_size_in_bytes) / 1024
+    stage1_table_size = (len(stage1) * 4) / 1024
+    stage2_table_size = (len(stage2) * 4) / 1024
+    total_size = code_points_size + stage1_table_size + stage2_table_size
+
+    if args.info:
+        print(
+            'Uncompressed code points table size: %d kilobytes' % ((len(codepoints) * element_size_in_bytes) / 1024))
+        print('Compressed code points table size: %d kilobytes' % (code_points_size))
+        print('Stage1 table size: %d kilobytes' % (stage1_table_size))
+        print('Stage2 table size: %d kilobytes' % (stage2_table_size))
+        print('')
+        print('Total compressed size: %d kilobytes' % (total_size))
+
+    append('// Do NOT edit this file.\n')
+    append('// This file was programmatically generated by %s\n' % (FILE_NAME))
+    append('// It contains %d kilobytes of data.\n' % (total_size))
+    append('\n')
+
+    if args.no_stdint:
+        code_point_type = 'long'
+    else:
+        append('#include <stdint.h>\n')
+        append('\n')
+        code_point_type = 'int32_t'
+
+    prefix = args.prefix
+    prefix_upper = prefix.upper()
+
+    append('// ---------------------------------------------\n')
+    append('// Start of Public Interface\n')
+    append('// ---------------------------------------------\n')
+
+    append('\n')
+    append('#ifndef CODEPOINT_DEFINITIONS\n')
+    append('#define CODEPOINT_DEFINITIONS\n')
+    append('\n')
+
+    append(f'typedef {code_point_type} {prefix}codepoint;\n')
+    append('\n')
+
+    append(f'{prefix}codepoint {prefix}codepoint_tolower({prefix}codepoint character);\n')
+    append(f'{prefix}codepoint {prefix}codepoint_toupper({prefix}codepoint character);\n')
+    append(f'{prefix}codepoint {prefix}codepoint_totitle({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_todigit({prefix}codepoint character);\n')
+    append(f'long {prefix}codepoint_toflags({prefix}codepoint character);\n')
+    append('\n')
+    append(f'int {prefix}codepoint_islower({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_isupper({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_istitle({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_isdigit({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_isspace({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_iscntrl({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_ispunct({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_isemoji({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_isprint({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_isalpha({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_isalnum({prefix}codepoint character);\n')
+    append(f'int {prefix}codepoint_isvalid({prefix}codepoint character);\n')
+
+    # Write masks.
+    append('\n')
+    append(f"#define {prefix_upper}CODEPOINT_ALPHA 0x%0X // Unicode character classes 'Lm', 'Lt', 'Lu', 'Ll', 'Lo', 'Nl'\n" % (ALPHA_MASK))
+    append(f"#define {prefix_upper}CODEPOINT_DIGIT 0x%0X // Unicode character classes 'Nd', 'Nl'\n" % (DIGIT_MASK))
+    append(f'#define {prefix_upper}CODEPOINT_LOWER 0x%0x\n' % (LOWER_MASK))
+    append(f'#define {prefix_upper}CODEPOINT_UPPER 0x%0x\n' % (UPPER_MASK))
+    append(f"#define {prefix_upper}CODEPOINT_TITLE 0x%0x // Unicode character class 'Lt'\n" % (TITLE_MASK))
+    append(f"#define {prefix_upper}CODEPOINT_SPACE 0x%0x // Unicode character class 'Zs'\n" % (SPACE_MASK))
+    append(f'#define {prefix_upper}CODEPOINT_PRINTABLE 0x%0x\n' % (PRINTABLE_MASK))
+    append(f"#define {prefix_upper}CODEPOINT_PUNCTUATION 0x%0x // Unicode character classes 'Pc', 'Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po'\n" % (PUNCTUATION_MASK))
+    append(f"#define {prefix_upper}CODEPOINT_CONTROL 0x%0x // Unicode character class 'Cc'\n" % (CONTROL_MASK))
+    append(f'#define {prefix_upper}CODEPOINT_EMOJI 0x%0x\n' % (EMOJI_MASK))
+    append(f'#define {prefix_upper}CODEPOINT_LINEBREAK 0x%0x\n' % (LINEBREAK_MASK))
+    append(f"#define {prefix_upper}CODEPOINT_CONNECTING 0x%0x // Unicode character class 'Pc'\n" % (CONNECTING_MASK))
+    append(f"#define {prefix_upper}CODEPOINT_COMBINING 0x%0x // Unicode character classes 'Mn', 'Mc'\n" % (COMBINING_MASK))
+    append(f"#define {prefix_upper}CODEPOINT_FORMATTING 0x%0x // Unicode character class 'Cf'\n" % (FORMATTING_MASK))
+
+    append('\n')
+    append('#endif\n')  # end of definitions
+    append('\n')
+
+    append('// ---------------------------------------------\n')
+    append('// End of Public Interface\n')
+    append('// ---------------------------------------------\n')
+
+    append('\n')
+    # beginning of implementation
+    append('#ifdef CODEPOINT_IMPLEMENTATION\n')
+    append('\n')
+
+    # Write unique codepoints.
+    append('// This table is a set of %d unique code points.\n' % (len(unique_codepoints)))
+    append('// It is %d bytes in size.\n' % (len(unique_codepoints) * element_size_in_bytes))
+    append(f'static const struct {prefix}codepointdata {{\n')
+    append(f'    {prefix}codepoint upper;\n')
+    append(f'    {prefix}codepoint lower;\n')
+    append(f'    {prefix}codepoint title;\n')
+    append('    int numeric_value;\n')
+    append(f'    {code_point_type} flags;\n')
+    append('} unicode_codepoints[] = {\n')
+    for record in unique_codepoints:
+        append('    {%d, %d, %d, %d, %d},\n' % record)  # The fields are formatted in declaration order.
+    append('};\n\n')
+
+    # Write stage1 table.
+    append(f'static const {prefix}codepoint stage1_table[] = {{')
+    append(format_table(stage1))
+    append('\n')
+    append('};\n\n')
+
+    # Write stage2 table.
+    append(f'static const {prefix}codepoint stage2_table[] = {{')
+    append(format_table(stage2))
+    append('\n')
+    append('};\n\n')
+
+    # If the inline keyword is enabled, then generate the following function with it.
+    inline_keyword = '' if args.no_inline else 'inline '
+
+    # Write helper function.
+    append(f'static {inline_keyword}const struct {prefix}codepointdata *{prefix}getcodepointdata({prefix}codepoint ch) {{\n')
+    append('    if (ch >= %d) {\n' % (MAX_CODEPOINTS))
+    append('        return &unicode_codepoints[0]; // code point out of range\n')
+    append('    }\n')
+    append('    const int stage2_offset = stage1_table[ch / %d];\n' % (BUCKET_SIZE))
+    append('    const int codepoint_index = stage2_table[stage2_offset + (ch %% %d)];\n' % (BUCKET_SIZE))
+    append('    return &unicode_codepoints[codepoint_index];\n')
+    append('}\n\n')
+
+    # Write API functions.
+    append(f'{prefix}codepoint {prefix}codepoint_tolower({prefix}codepoint character) {{\n')
+    append(f'    const {prefix}codepoint cp = {prefix}getcodepointdata(character)->lower;\n')
+    append('    return (cp == 0) ? character : cp;\n')
+    append('}\n\n')
+
+    append(f'{prefix}codepoint {prefix}codepoint_toupper({prefix}codepoint character) {{\n')
+    append(f'    const {prefix}codepoint cp = {prefix}getcodepointdata(character)->upper;\n')
+    append('    return (cp == 0) ? character : cp;\n')
+    append('}\n\n')
+
+    append(f'{prefix}codepoint {prefix}codepoint_totitle({prefix}codepoint character) {{\n')
+    append(f'    const {prefix}codepoint cp = {prefix}getcodepointdata(character)->title;\n')
+    append('    return (cp == 0) ? character : cp;\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_todigit({prefix}codepoint character) {{\n')
+    append(f'    return {prefix}getcodepointdata(character)->numeric_value;\n')
+    append('}\n\n')
+
+    append(f'long {prefix}codepoint_toflags({prefix}codepoint character) {{\n')
+    append(f'    return {prefix}getcodepointdata(character)->flags;\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_islower({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_LOWER);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_isupper({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_UPPER);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_istitle({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_TITLE);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_isdigit({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_DIGIT);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_isspace({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_SPACE);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_ispunct({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_PUNCTUATION);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_isprint({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_PRINTABLE);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_iscntrl({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_CONTROL);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_isemoji({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_EMOJI);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_isalpha({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & {prefix_upper}CODEPOINT_ALPHA);\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_isalnum({prefix}codepoint character) {{\n')
+    append(f'    return !!({prefix}getcodepointdata(character)->flags & ({prefix_upper}CODEPOINT_ALPHA | {prefix_upper}CODEPOINT_DIGIT));\n')
+    append('}\n\n')
+
+    append(f'int {prefix}codepoint_isvalid({prefix}codepoint character) {{\n')
+    append(f'    return {prefix}getcodepointdata(character) != &unicode_codepoints[0];\n')
+    append('}\n\n')
+
+    append('#endif\n')  # end of implementation
+    append('\n')
+
+    # The output is encoded before the file is opened so a failure never leaves a truncated header behind.
+    # It's UTF-8 since the prefix and script name are user supplied and may not be ASCII.
+    data = ''.join(output).encode('utf-8')
+    with open(args.outfile, 'wb') as file:
+        file.write(data)
 
 if __name__ == "__main__":
     # This script relies on Python 3.6's ordred dictionary feature.
@@ -21,418 +21,453 @@ import subprocess
 import os
 import sys
 import json
+import concurrent.futures
+from types import MappingProxyType
 
-class TestUnicodeUtility(unittest.TestCase):
-    # Verify the usage instructions are printed when no argument is given.
-    def test_no_arguments(self):
-        output, exit_code = self.execute_compiler([])
-        self.assertEqual(output, "usage: unicode [--json] codepoint\n")
-        self.assertEqual(exit_code, 1)
-
+# The code points tested below along with their expected attributes.
+# Each entry is the name of the test, the code point, and the expected JSON output of the unicode utility.
+# The expected output is built once when the module is imported and is read-only so tests can't modify it.
+CASES = [
     # 'LOW LINE' (U+005F)
     # Test a code point that indicates a connecting character.
-    def test_underscore(self):
-        output, exit_code = self.execute_compiler(["--json", "U+005F"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 95)
-        self.assertEqual(output['toUpperCase'], 95)
-        self.assertEqual(output['toTitleCase'], 95)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 1)
-        self.assertEqual(output['isConnectingChar'], 1)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("underscore", "U+005F", MappingProxyType({
+        'toLowerCase': 95,
+        'toUpperCase': 95,
+        'toTitleCase': 95,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 1,
+        'isConnectingChar': 1,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 1,
+    })),
 
     # 'LINE SEPARATOR' (U+2028)
     # Test a code point that indicates a line break.
-    def test_line_separator(self):
-        output, exit_code = self.execute_compiler(["--json", "U+2028"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 8232)
-        self.assertEqual(output['toUpperCase'], 8232)
-        self.assertEqual(output['toTitleCase'], 8232)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 1)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 0)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("line_separator", "U+2028", MappingProxyType({
+        'toLowerCase': 8232,
+        'toUpperCase': 8232,
+        'toTitleCase': 8232,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 1,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 0,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 1,
+    })),
 
     # 'LATIN CAPITAL LETTER Z' (U+005A)
     # Test a code point with a lower and upper case, but not a title case.
-    def test_latin_capital_letter_Z(self):
-        output, exit_code = self.execute_compiler(["--json", "U+005A"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 122)
-        self.assertEqual(output['toUpperCase'], 90)
-        self.assertEqual(output['toTitleCase'], 90)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 1)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 1)
-        self.assertEqual(output['isAlphaNumeric'], 1)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("latin_capital_letter_Z", "U+005A", MappingProxyType({
+        'toLowerCase': 122,
+        'toUpperCase': 90,
+        'toTitleCase': 90,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 1,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 1,
+        'isAlphaNumeric': 1,
+        'isValidCodePoint': 1,
+    })),
 
     # 'TIBETAN MARK BSKA- SHOG GI MGO RGYAN' (U+0FD0)
     # Test a punctuation character.
-    def test_tibetan_mark_bska_shog_gi_mgo_rgyan(self):
-        output, exit_code = self.execute_compiler(["--json", "U+0FD0"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 4048)
-        self.assertEqual(output['toUpperCase'], 4048)
-        self.assertEqual(output['toTitleCase'], 4048)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 1)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("tibetan_mark_bska_shog_gi_mgo_rgyan", "U+0FD0", MappingProxyType({
+        'toLowerCase': 4048,
+        'toUpperCase': 4048,
+        'toTitleCase': 4048,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 1,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 1,
+    })),
 
     # 'NARROW NO-BREAK SPACE' (U+202F)
     # Test a space character.
-    def test_narrow_no_break_space(self):
-        output, exit_code = self.execute_compiler(["--json", "U+202F"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 8239)
-        self.assertEqual(output['toUpperCase'], 8239)
-        self.assertEqual(output['toTitleCase'], 8239)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 1)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 0)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("narrow_no_break_space", "U+202F", MappingProxyType({
+        'toLowerCase': 8239,
+        'toUpperCase': 8239,
+        'toTitleCase': 8239,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 1,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 0,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 1,
+    })),
 
     # 'SPACE' (U+0020)
     # Test a space character that's considered printable.
-    def test_space(self):
-        output, exit_code = self.execute_compiler(["--json", "U+0020"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 32)
-        self.assertEqual(output['toUpperCase'], 32)
-        self.assertEqual(output['toTitleCase'], 32)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 1)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("space", "U+0020", MappingProxyType({
+        'toLowerCase': 32,
+        'toUpperCase': 32,
+        'toTitleCase': 32,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 1,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 1,
+    })),
 
     # 'SYNCHRONOUS IDLE' (U+0016)
     # Test a control character.
-    def test_synchronous_idle(self):
-        output, exit_code = self.execute_compiler(["--json", "U+0016"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 22)
-        self.assertEqual(output['toUpperCase'], 22)
-        self.assertEqual(output['toTitleCase'], 22)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 1)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 0)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("synchronous_idle", "U+0016", MappingProxyType({
+        'toLowerCase': 22,
+        'toUpperCase': 22,
+        'toTitleCase': 22,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 1,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 0,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 1,
+    })),
 
     # 'HANGUL SYLLABLE HIK' (U+D7A0)
     # Test a code point generated from a range of code points.
-    def test_hangul_syllable_hik(self):
-        output, exit_code = self.execute_compiler(["--json", "U+D7A0"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 55200)
-        self.assertEqual(output['toUpperCase'], 55200)
-        self.assertEqual(output['toTitleCase'], 55200)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 1)
-        self.assertEqual(output['isAlphaNumeric'], 1)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("hangul_syllable_hik", "U+D7A0", MappingProxyType({
+        'toLowerCase': 55200,
+        'toUpperCase': 55200,
+        'toTitleCase': 55200,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 1,
+        'isAlphaNumeric': 1,
+        'isValidCodePoint': 1,
+    })),
 
     # 'ARABIC-INDIC DIGIT SEVEN' (U+0667)
     # Test a code point that's a digit.
-    def test_arabic_indic_digit_seven(self):
-        output, exit_code = self.execute_compiler(["--json", "U+0667"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 1639)
-        self.assertEqual(output['toUpperCase'], 1639)
-        self.assertEqual(output['toTitleCase'], 1639)
-        self.assertEqual(output['toDigit'], 7)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 1)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 1)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
-
+    ("arabic_indic_digit_seven", "U+0667", MappingProxyType({
+        'toLowerCase': 1639,
+        'toUpperCase': 1639,
+        'toTitleCase': 1639,
+        'toDigit': 7,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 1,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 0,
+        'isAlphaNumeric': 1,
+        'isValidCodePoint': 1,
+    })),
 
     # 'SUPERSCRIPT THREE' (U+00B3)
     # Test a code point with a digit representation, but that's not a digit.
-    def test_superscript_one(self):
-        output, exit_code = self.execute_compiler(["--json", "U+00B3"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 179)
-        self.assertEqual(output['toUpperCase'], 179)
-        self.assertEqual(output['toTitleCase'], 179)
-        self.assertEqual(output['toDigit'], 3)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("superscript_one", "U+00B3", MappingProxyType({
+        'toLowerCase': 179,
+        'toUpperCase': 179,
+        'toTitleCase': 179,
+        'toDigit': 3,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 1,
+    })),
 
     # 'LATIN CAPITAL LETTER DZ WITH CARON' (U+01C4)
     # Test a upper case code point with a unique lower case and title case.
-    def test_latin_capital_letter_DZ_with_caron(self):
-        output, exit_code = self.execute_compiler(["--json", "U+01C4"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 454)
-        self.assertEqual(output['toUpperCase'], 452)
-        self.assertEqual(output['toTitleCase'], 453)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 1)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 1)
-        self.assertEqual(output['isAlphaNumeric'], 1)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("latin_capital_letter_DZ_with_caron", "U+01C4", MappingProxyType({
+        'toLowerCase': 454,
+        'toUpperCase': 452,
+        'toTitleCase': 453,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 1,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 1,
+        'isAlphaNumeric': 1,
+        'isValidCodePoint': 1,
+    })),
 
     # 'LATIN CAPITAL LETTER D WITH SMALL LETTER Z WITH CARON' (U+01C5)
     # Test a title case code point with a unique lower case and upper case.
-    def test_latin_capital_letter_D_with_small_letter_Z_with_caron(self):
-        output, exit_code = self.execute_compiler(["--json", "U+01C5"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 454)
-        self.assertEqual(output['toUpperCase'], 452)
-        self.assertEqual(output['toTitleCase'], 453)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 1)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 1)
-        self.assertEqual(output['isAlphaNumeric'], 1)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("latin_capital_letter_D_with_small_letter_Z_with_caron", "U+01C5", MappingProxyType({
+        'toLowerCase': 454,
+        'toUpperCase': 452,
+        'toTitleCase': 453,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 1,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 1,
+        'isAlphaNumeric': 1,
+        'isValidCodePoint': 1,
+    })),
 
     # 'LATIN SMALL LETTER DZ WITH CARON' (U+01C6)
     # Test a lower case code point with a unique upper case and title case.
-    def test_latin_small_letter_DZ_with_caron(self):
-        output, exit_code = self.execute_compiler(["--json", "U+01C6"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 454)
-        self.assertEqual(output['toUpperCase'], 452)
-        self.assertEqual(output['toTitleCase'], 453)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 1)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 1)
-        self.assertEqual(output['isAlphaNumeric'], 1)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("latin_small_letter_DZ_with_caron", "U+01C6", MappingProxyType({
+        'toLowerCase': 454,
+        'toUpperCase': 452,
+        'toTitleCase': 453,
+        'toDigit': 0,
+        'isLowerCase': 1,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 1,
+        'isAlpha': 1,
+        'isAlphaNumeric': 1,
+        'isValidCodePoint': 1,
+    })),
 
     # 'PILE OF POO' (U+1F4A9)
     # Test an Emoji.
-    def test_pile_of_poo(self):
-        output, exit_code = self.execute_compiler(["--json", "U+1F4A9"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 128169)
-        self.assertEqual(output['toUpperCase'], 128169)
-        self.assertEqual(output['toTitleCase'], 128169)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 1)
-        self.assertEqual(output['isPrintable'], 1)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 1)
-        self.assertEqual(exit_code, 0)
+    ("pile_of_poo", "U+1F4A9", MappingProxyType({
+        'toLowerCase': 128169,
+        'toUpperCase': 128169,
+        'toTitleCase': 128169,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 1,
+        'isPrintable': 1,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 1,
+    })),
 
     # Test an invalid code point (U+F4F1)
-    def test_invalid_character(self):
-        output, exit_code = self.execute_compiler(["--json", "U+F4F1"])
-        output = json.loads(output)
-        self.assertEqual(output['toLowerCase'], 62705)
-        self.assertEqual(output['toUpperCase'], 62705)
-        self.assertEqual(output['toTitleCase'], 62705)
-        self.assertEqual(output['toDigit'], 0)
-        self.assertEqual(output['isLowerCase'], 0)
-        self.assertEqual(output['isUpperCase'], 0)
-        self.assertEqual(output['isTitleCase'], 0)
-        self.assertEqual(output['isDigit'], 0)
-        self.assertEqual(output['isSpaceChar'], 0)
-        self.assertEqual(output['isLineBreak'], 0)
-        self.assertEqual(output['isISOControl'], 0)
-        self.assertEqual(output['isPunctuation'], 0)
-        self.assertEqual(output['isConnectingChar'], 0)
-        self.assertEqual(output['isFormattingChar'], 0)
-        self.assertEqual(output['isCombiningChar'], 0)
-        self.assertEqual(output['isEmoji'], 0)
-        self.assertEqual(output['isPrintable'], 0)
-        self.assertEqual(output['isAlpha'], 0)
-        self.assertEqual(output['isAlphaNumeric'], 0)
-        self.assertEqual(output['isValidCodePoint'], 0)
-        self.assertEqual(exit_code, 0)
+    ("invalid_character", "U+F4F1", MappingProxyType({
+        'toLowerCase': 62705,
+        'toUpperCase': 62705,
+        'toTitleCase': 62705,
+        'toDigit': 0,
+        'isLowerCase': 0,
+        'isUpperCase': 0,
+        'isTitleCase': 0,
+        'isDigit': 0,
+        'isSpaceChar': 0,
+        'isLineBreak': 0,
+        'isISOControl': 0,
+        'isPunctuation': 0,
+        'isConnectingChar': 0,
+        'isFormattingChar': 0,
+        'isCombiningChar': 0,
+        'isEmoji': 0,
+        'isPrintable': 0,
+        'isAlpha': 0,
+        'isAlphaNumeric': 0,
+        'isValidCodePoint': 0,
+    })),
+]
+
+class TestUnicodeUtility(unittest.TestCase):
+    # The code points queried by the tests below.
+    # They're all looked up by a single batch invocation of the unicode utility rather than one invocation per test.
+    CODEPOINTS = [codepoint for _, codepoint, _ in CASES]
+
+    # A few representative code points that are also passed as an argument to verify the single code point path.
+    # The batch and single code point paths share their parsing and serialization so these are enough to cover it.
+    SINGLE_CODEPOINTS = [
+        "U+005F",
+        "U+D7A0",  # generated from a range of code points
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        # Resolve the unicode utility once for the whole test case rather than on every invocation.
+        cls.executable = os.path.abspath("example")
+        if not os.path.exists(cls.executable):
+            print("executable missing; be sure to run 'make' before running tests")
+            sys.exit(1)
+
+        # Every invocation of the unicode utility happens up front so the tests themselves do no process work.
+        # The invocations are independent of each other so they're run concurrently.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            batch = executor.submit(cls.execute_compiler, ["--json", "--batch"], "\n".join(cls.CODEPOINTS))
+            no_arguments = executor.submit(cls.execute_compiler, [])
+            batch_with_argument = executor.submit(cls.execute_compiler, ["--json", "--batch", "U+0041"])
+            singles = {codepoint: executor.submit(cls.execute_compiler, ["--json", codepoint]) for codepoint in cls.SINGLE_CODEPOINTS}
+
+        # The batch output must have exactly one line per code point, otherwise the lines can't be matched up.
+        output, cls.batch_exit_code = batch.result()
+        lines = output.splitlines()
+        if len(lines) != len(cls.CODEPOINTS):
+            raise AssertionError("expected %d lines of batch output, got %d" % (len(cls.CODEPOINTS), len(lines)))
+        cls.results = dict(zip(cls.CODEPOINTS, lines))
+        cls.no_arguments_result = no_arguments.result()
+        cls.batch_with_argument_result = batch_with_argument.result()
+        cls.single_results = {codepoint: future.result() for codepoint, future in singles.items()}
+
+    # Verify the usage instructions are printed when no argument is given.
+    def test_no_arguments(self):
+        output, exit_code = self.no_arguments_result
+        self.assertEqual(output, b"usage: unicode [--json] [--batch] [codepoint]\n")
+        self.assertEqual(exit_code, 1)
+
+    # Verify a code point argument is rejected in batch mode, where code points are read from stdin.
+    def test_batch_with_argument(self):
+        output, exit_code = self.batch_with_argument_result
+        self.assertEqual(output, b"usage: unicode [--json] [--batch] [codepoint]\n")
+        self.assertEqual(exit_code, 1)
+
+    # Verify the attributes of every code point in the table of test cases.
+    def test_codepoints(self):
+        for name, codepoint, expected in CASES:
+            with self.subTest(name=name, codepoint=codepoint):
+                output, exit_code = self.lookup(codepoint)
+                self.assertEqual(json.loads(output), dict(expected))  # Compare dicts for a field-by-field diff on failure.
+                self.assertEqual(exit_code, 0)
+
+    # Verify passing a code point as an argument produces the same output as looking it up in batch mode.
+    def test_codepoint_argument(self):
+        for codepoint in self.SINGLE_CODEPOINTS:
+            with self.subTest(codepoint=codepoint):
+                output, exit_code = self.single_results[codepoint]
+                self.assertEqual(output, self.results[codepoint])
+                self.assertEqual(exit_code, 0)
 
     # --------------------------------------------------------------------------------
     #
@@ -441,16 +476,18 @@ class TestUnicodeUtility(unittest.TestCase):
     #
     # --------------------------------------------------------------------------------
 
+    # A helper method to retrieve the JSON output of the unicode utility for a code point.
+    # The output was gathered for all code points when the test case was set up.
+    # This is used by tests, but is not a test itself.
+    def lookup(self, codepoint):
+        return (self.results[codepoint], self.batch_exit_code)
+
     # A helper method to execute the unicode utility.
     # This is used by tests, but is not a test itself.
-    def execute_compiler(self, options = []):
-        if not os.path.exists("example"):
-            print("executable missing; be sure to run 'make' before running tests")
-            sys.exit(1)
-        process = subprocess.Popen(["./example"] + options, stdout=subprocess.PIPE)
-        output, error = process.communicate()
-        exit_code = process.wait()
-        return (output.decode("ascii"), exit_code)
+    @classmethod
+    def execute_compiler(cls, options = [], stdin = ""):
+        process = subprocess.run([cls.executable] + options, input=stdin.encode("ascii"), stdout=subprocess.PIPE)
+        return (process.stdout, process.returncode)  # json.loads() accepts bytes so the output is left undecoded.
 
 if __name__ == "__main__":
     unittest.main()